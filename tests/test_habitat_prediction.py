@@ -0,0 +1,47 @@
+import numpy as np
+import pytest
+
+from automatic_nasa_framework import AutomaticNASAFramework
+
+
+@pytest.fixture(scope='module')
+def framework():
+    return AutomaticNASAFramework('great_white')
+
+
+def _environment(sst=18.0, chl=1.5, depth=-150.0, n=4):
+    return {
+        'sst': {'data': np.full((n, n), sst, dtype=np.float32)},
+        'chlorophyll': {'data': np.full((n, n), chl, dtype=np.float32)},
+        'bathymetry': {'data': np.full((n, n), depth, dtype=np.float32)},
+    }
+
+
+@pytest.mark.parametrize('key, default', [('sst', 20.0), ('chlorophyll', 1.0), ('bathymetry', -100.0)])
+def test_none_data_uses_default_grid(framework, key, default):
+    environment = _environment()
+    environment[key] = {'data': None}
+    expected = _environment()
+    expected[key] = {'data': np.full((4, 4), default, dtype=np.float32)}
+
+    result = framework.advanced_habitat_prediction(environment)
+
+    assert np.isfinite(result['hsi']).all()
+    assert 'error' not in result['statistics']
+    reference = framework.advanced_habitat_prediction(expected)
+    for name in ('temperature', 'productivity', 'depth'):
+        np.testing.assert_array_equal(result['components'][name], reference['components'][name])
+
+
+@pytest.mark.parametrize('key', ['sst', 'chlorophyll'])
+def test_nan_cell_scores_zero_suitability(framework, key):
+    environment = _environment()
+    environment[key]['data'][1, 2] = np.nan
+
+    result = framework.advanced_habitat_prediction(environment)
+
+    assert np.isfinite(result['hsi']).all()
+    assert np.isfinite(result['uncertainty']).all()
+    assert result['components']['productivity'][1][2] == 0.0
+    if key == 'sst':
+        assert result['components']['temperature'][1][2] == 0.0